@@ -1,6 +1,7 @@
-r""" The core of continuous integration / continuous delivery by performing tests,
+r"""The core of continuous integration / continuous delivery by performing tests,
 coverage, formatting, and package building. If errors produced by this script are
-corrected, the remove CICD pipeline should complete successfully.
+corrected, the remove CICD pipeline should complete successfully. When run locally,
+black and flake8 only check Python files changed since the last commit.
 
 Examples
 --------
@@ -8,6 +9,10 @@ Examples
 python cicd_template.py
 #### using command line arguments for server specification
 python cicd_template.py --server=localhost\SQLEXPRESS
+#### run only the second of four test shards
+python cicd_template.py --shard-index=1 --shard-count=4
+#### combine results downloaded from all shards then report and build
+python cicd_template.py --combine-shards
 
 See Also
 --------
@@ -22,8 +27,12 @@ import os
 import shutil
 import subprocess
 import argparse
+import functools
 import glob
 import sys
+import tempfile
+from xml.etree import ElementTree
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 package_name = "mssql_dataframe"
 venv_dir = "env"
@@ -37,42 +46,145 @@ coverage_file = "reports/.coverage"
 coverage_xml = "reports/coverage.xml"
 coverage_fail_under = 100
 genbadge_dir = "reports"
+shard_dir = "reports/shards"
 
+# virtual environment executables, resolved once for every command
+venv_bin = os.path.join(os.getcwd(), venv_dir, "Scripts")
 
-def run_cmd(cmd, venv=True):
-    """Generic command line process and error if needed. Otherwise stdout is returned."""
+
+@functools.lru_cache(maxsize=None)
+def venv_executable(name):
+    """Absolute path to an executable in the virtual environment, resolved once per name."""
+    # resolve the file extension once instead of for every process started
+    return shutil.which(name, path=venv_bin) or os.path.join(venv_bin, name)
+
+
+def run_cmd(cmd, venv=True, description=None):
+    """Generic command line process that streams stdout to the console and errors if needed."""
+    # report progress, only joining the command when the caller gave no description
+    if description is None:
+        print(f"Running '{' '.join(cmd)}'.")
+    else:
+        print(f"{description}.")
     # run all commands in virtual environment by default
     if venv:
-        cmd[0] = os.path.join(os.getcwd(), "env", "Scripts", cmd[0])
-    # call command line process
-    status = subprocess.run(cmd, capture_output=True)
-    if status.returncode != 0:
-        if len(status.stderr) > 0:
-            msg = status.stderr.decode("utf-8")
-        else:
-            msg = status.stdout.decode("utf-8")
-        msg = (
-            "stderr:\n"
-            + status.stderr.decode("utf-8")
-            + "\n\nstdout:\n"
-            + status.stdout.decode("utf-8")
-        )
-        raise RuntimeError(msg)
+        cmd[0] = venv_executable(cmd[0])
+    # spool output to disk instead of holding it in memory
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        # call command line process, teeing stdout to the console as it is produced
+        sys.stdout.flush()
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr) as process:
+            for line in process.stdout:
+                sys.stdout.buffer.write(line)
+                stdout.write(line)
+            sys.stdout.flush()
+        if process.returncode != 0:
+            stdout.seek(0)
+            stderr.seek(0)
+            msg = (
+                f"command: {' '.join(cmd)}\n\n"
+                + "stderr:\n"
+                + stderr.read().decode("utf-8")
+                + "\n\nstdout:\n"
+                + stdout.read().decode("utf-8")
+            )
+            raise RuntimeError(msg)
+
+
+def run_concurrently(calls):
+    """Run independent calls that each wait on a separate process using threads."""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        # raise the first failure encountered
+        for future in as_completed(futures):
+            future.result()
+
+
+def parse_args():
+    # optional arguments defined by conftest.py options
+    sys.path.insert(1, os.path.join(sys.path[0], ".."))
+    from conftest import options
+
+    parser = argparse.ArgumentParser()
+    for opt in options:
+        parser.add_argument(opt, **options[opt])
+
+    # split tests across separate CI jobs using pytest-shard
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        default=None,
+        help="Index of the test shard to run, from 0 to shard-count - 1.",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=None,
+        help="Total number of test shards.",
+    )
+    parser.add_argument(
+        "--combine-shards",
+        action="store_true",
+        help=f"Combine shard results downloaded to '{shard_dir}' then report and build.",
+    )
+    args = parser.parse_args()
+
+    if (args.shard_index is None) != (args.shard_count is None):
+        parser.error("--shard-index and --shard-count must be specified together.")
+    if args.combine_shards and args.shard_index is not None:
+        parser.error("--combine-shards cannot be used with --shard-index.")
 
-    return status.stdout.decode("utf-8")
+    return args, options
 
 
-def remove_output_dirs():
-    for dir in [build_dir, build_test_dir, markdown_test_dir, "reports"]:
+def remove_output_dirs(keep_reports=False):
+    # generated markdown tests are kept and only regenerated if changed
+    dirs = [build_dir, build_test_dir]
+    # shard results are downloaded into reports before combining
+    if not keep_reports:
+        dirs += ["reports"]
+    for dir in dirs:
         if os.path.exists(dir):
             shutil.rmtree(dir)
 
 
+@functools.lru_cache(maxsize=None)
+def changed_files():
+    """Python files changed since the last commit, or None if every file should be checked."""
+    # always check every file in CICD pipelines
+    if os.environ.get("TF_BUILD") or os.environ.get("CI"):
+        return None
+
+    files = set()
+    for cmd in [
+        ["git", "diff", "--name-only", "HEAD"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]:
+        status = subprocess.run(cmd, capture_output=True, text=True)
+        if status.returncode != 0:
+            return None
+        files.update(status.stdout.splitlines())
+
+    # skip deleted files and generated or environment files
+    exclude = tuple(f"{dir}/" for dir in [venv_dir, markdown_test_dir, build_test_dir])
+    files = [
+        f
+        for f in sorted(files)
+        if f.endswith(".py") and not f.startswith(exclude) and os.path.exists(f)
+    ]
+
+    # a clean working tree checks every file
+    if len(files) == 0:
+        return None
+
+    return files
+
+
 def check_black_formatting():
-    cmd = ["black", ".", "--check", f"--extend-exclude={markdown_test_dir}"]
-    print(f"Checking code format '{' '.join(cmd)}'.")
+    paths = changed_files() or ["."]
+    cmd = ["black", *paths, "--check", f"--extend-exclude={markdown_test_dir}"]
     try:
-        _ = run_cmd(cmd)
+        _ = run_cmd(cmd, description="Checking code format")
     except RuntimeError as err:
         raise RuntimeError(
             f"black format check failed. Run 'black . --extend-exclude={markdown_test_dir}' to automatically apply format changes.",
@@ -84,35 +196,32 @@ def check_flake8_style():
     exclude = f"{venv_dir}, {markdown_test_dir}, {build_test_dir}"
     cmd = [
         "flake8",
+        *(changed_files() or []),
         f"--output-file={flake8_file}",
         "--tee",
         f"--extend-exclude={exclude}",
     ]
-    print(f"Checking code style '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
+    _ = run_cmd(cmd, description="Checking code style")
     print(f"Generated flake8 statistics file '{flake8_file}'.")
 
 
 def check_bandit_security():
     cmd = ["bandit", "-c", "pyproject.toml", "-r", package_name]
-    print(f"Checking security '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
+    _ = run_cmd(cmd, description="Checking security")
 
 
 def check_docstring_formatting():
     cmd = ["pydocstyle", package_name, "--convention=numpy"]
-    print(f"Checking docstring format '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
-
-
-def run_docstring_pytest():
-    cmd = ["pytest", package_name, "--doctest-modules"]
-    print(f"Running docstring tests '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
+    _ = run_cmd(cmd, description="Checking docstring format")
 
 
 def generate_markdown_pytest():
-    os.mkdir(markdown_test_dir)
+    # generate tests in-process to avoid an interpreter startup per file
+    from phmdoctest import __version__ as phmdoctest_version
+    from phmdoctest.main import testfile
+
+    # keep previously generated tests so unchanged files can be skipped
+    os.makedirs(markdown_test_dir, exist_ok=True)
 
     markdown_test_files = {}
     dir = os.getcwd()
@@ -121,71 +230,149 @@ def generate_markdown_pytest():
             file_out = file_in.replace(".md", "")
             markdown_test_files[file_in] = f"{markdown_test_dir}/test_{file_out}.py"
 
-    for file_in, file_out in markdown_test_files.items():
-        cmd = [
-            "phmdoctest",
-            file_in,
-            "--outfile",
-            file_out,
-        ]
-        print(f"Generating markdown test '{' '.join(cmd)}'")
-        _ = run_cmd(cmd)
+    # remove tests generated from markdown files that were deleted or renamed
+    for file_out in glob.glob(f"{markdown_test_dir}/test_*.py"):
+        if file_out.replace(os.sep, "/") not in markdown_test_files.values():
+            print(f"Removing markdown test '{file_out}' without a markdown file.")
+            os.remove(file_out)
+
+    # regenerate every test in CICD pipelines or if phmdoctest has changed
+    version_file = f"{markdown_test_dir}/phmdoctest_version.txt"
+    regenerate = bool(os.environ.get("TF_BUILD") or os.environ.get("CI"))
+    if os.path.exists(version_file):
+        with open(version_file, encoding="utf-8") as fh:
+            regenerate = regenerate or fh.read() != phmdoctest_version
+    else:
+        regenerate = True
 
+    for file_in, file_out in markdown_test_files.items():
+        # changes to how tests are generated in this file also regenerate tests
+        modified = max(os.path.getmtime(file_in), os.path.getmtime(__file__))
+        if (
+            not regenerate
+            and os.path.exists(file_out)
+            and os.path.getmtime(file_out) >= modified
+        ):
+            print(f"Markdown test '{file_out}' is up to date.")
+            continue
+        print(f"Generating markdown test '{file_out}' from '{file_in}'.")
+        with open(file_out, "w", encoding="utf-8") as fh:
+            fh.write(testfile(file_in, built_from=file_in))
+
+    with open(version_file, "w", encoding="utf-8") as fh:
+        fh.write(phmdoctest_version)
+
+
+def run_coverage_pytest(args, options):
+    # separate test results for each shard so they can be merged later
+    if args.shard_index is None:
+        junitxml = pytest_file
+    else:
+        junitxml = pytest_file.replace(".xml", f".{args.shard_index}.xml")
 
-def run_coverage_pytest():
     # required arguments
     cmd = [
-        "coverage",
-        "run",
-        "--branch",
-        f"--data-file={coverage_file}",
-        "-m",
-        f"--source={package_name}",
         "pytest",
-        f"--junitxml={pytest_file}",
+        # run docstring examples in the same session as the test suite
+        package_name,
+        "tests",
+        "--doctest-modules",
+        # distribute test files across all cores, each file stays on a single worker
+        "-n",
+        "auto",
+        "--dist=loadfile",
+        f"--junitxml={junitxml}",
+        # measure coverage in-process using pytest-cov, including xdist workers
+        f"--cov={package_name}",
+        "--cov-branch",
     ]
 
-    # add optional arguments defined by conftest.py options
-    sys.path.insert(1, os.path.join(sys.path[0], ".."))
-    from conftest import options
+    # a shard only writes coverage data, reports are generated after combining shards
+    if args.shard_index is None:
+        cmd += [
+            f"--cov-report=html:{coverage_dir}",
+            f"--cov-report=xml:{coverage_xml}",
+            f"--cov-fail-under={coverage_fail_under}",
+        ]
+    else:
+        cmd += ["--cov-report="]
 
-    parser = argparse.ArgumentParser()
+    # add optional arguments defined by conftest.py options
     for opt in options:
-        parser.add_argument(opt, **options[opt])
-    args = parser.parse_args()
-    args = vars(args)
-    args = {k: v for k, v in args.items() if v is not None}
-    cmd += ["--" + k + "=" + v for k, v in args.items()]
+        value = getattr(args, opt.lstrip("-"))
+        if value is not None:
+            cmd += [opt + "=" + value]
+
+    # only run tests in this shard
+    if args.shard_index is not None:
+        cmd += [f"--num-shards={args.shard_count}", f"--shard-id={args.shard_index}"]
+
+    _ = run_cmd(cmd, description="Running coverage and tests")
+    print(f"Generated test xml file '{junitxml}'.")
+    if args.shard_index is None:
+        print(
+            f"Generated coverage html file '{os.path.join(coverage_dir, 'index.html')}'."
+        )
+        print(f"Generated coverage xml file '{coverage_xml}'.")
 
-    # use coverage to call pytest
-    print(f"Running coverage and tests '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
-    print(f"Generated coverage sqlite file '{coverage_file}'.")
-    print(f"Generated test xml file '{pytest_file}'.")
 
+def combine_shard_tests():
+    # merge test results from each shard into a single file
+    files = glob.glob(os.path.join(shard_dir, "**", "test.*.xml"), recursive=True)
+    if len(files) == 0:
+        raise RuntimeError(f"No shard test results found in '{shard_dir}'.")
 
-def report_coverage_output():
-    _ = run_cmd(
-        [
-            "coverage",
-            "html",
-            f"--data-file={coverage_file}",
-            f"--directory={coverage_dir}",
-        ]
+    combined = ElementTree.Element("testsuites")
+    for fp in sorted(files):
+        root = ElementTree.parse(fp).getroot()
+        if root.tag == "testsuite":
+            combined.append(root)
+        else:
+            combined.extend(root.findall("testsuite"))
+    ElementTree.ElementTree(combined).write(
+        pytest_file, encoding="utf-8", xml_declaration=True
     )
+    print(f"Combined {len(files)} shard test xml files into '{pytest_file}'.")
 
-    print(f"Generated coverage html file '{os.path.join(coverage_dir, 'index.html')}'.")
 
-    _ = run_cmd(
+def coverage_combine():
+    # merge data files from each shard, downloaded into separate directories
+    cmd = ["coverage", "combine", f"--data-file={coverage_file}"]
+    cmd += glob.glob(
+        os.path.join(shard_dir, "**", os.path.basename(coverage_file)),
+        recursive=True,
+    )
+    _ = run_cmd(cmd, description="Combining coverage data")
+    print(f"Generated coverage sqlite file '{coverage_file}'.")
+
+
+def report_coverage_output():
+    # html and xml reports only read the coverage data so generate them concurrently
+    run_concurrently(
         [
-            "coverage",
-            "xml",
-            f"--data-file={coverage_file}",
-            "-o",
-            f"{coverage_xml}",
-            f"--fail-under={coverage_fail_under}",
+            functools.partial(
+                run_cmd,
+                [
+                    "coverage",
+                    "html",
+                    f"--data-file={coverage_file}",
+                    f"--directory={coverage_dir}",
+                ],
+            ),
+            functools.partial(
+                run_cmd,
+                [
+                    "coverage",
+                    "xml",
+                    f"--data-file={coverage_file}",
+                    "-o",
+                    f"{coverage_xml}",
+                    f"--fail-under={coverage_fail_under}",
+                ],
+            ),
         ]
     )
+    print(f"Generated coverage html file '{os.path.join(coverage_dir, 'index.html')}'.")
     print(f"Generated coverage xml file '{coverage_xml}'.")
 
 
@@ -195,9 +382,19 @@ def generage_package_badges():
         "coverage": coverage_xml,
         "flake8": flake8_file,
     }
-    for b, i in badges.items():
-        fp = f"{genbadge_dir}/{b}.svg"
-        _ = run_cmd(["genbadge", b, "-i", i, "-o", fp])
+    # flake8 only checked changed files, so its report doesn't represent the package
+    if changed_files() is not None:
+        del badges["flake8"]
+        print("Skipping flake8 badge since only changed files were checked.")
+    badges = {b: (i, f"{genbadge_dir}/{b}.svg") for b, i in badges.items()}
+    # each badge is independent so generate them concurrently
+    run_concurrently(
+        [
+            functools.partial(run_cmd, ["genbadge", b, "-i", i, "-o", fp])
+            for b, (i, fp) in badges.items()
+        ]
+    )
+    for b, (_, fp) in badges.items():
         print(f"Generated badge for '{b}' at '{fp}'.")
 
 
@@ -210,34 +407,57 @@ def check_package_version():
 def build_python_package():
     # build package .gz and .whl files
     cmd = ["python", "-m", "build", f"--outdir={build_dir}"]
-    print(f"Building package '{' '.join(cmd)}'.")
-    _ = run_cmd(cmd)
+    _ = run_cmd(cmd, description="Building package")
 
 
 def test_python_package():
     # find build files
-    source = glob.glob(os.path.join(build_dir, "*.tar.gz"))[0]
-    wheel = glob.glob(os.path.join(build_dir, "*.whl"))[0]
+    try:
+        source = next(glob.iglob(os.path.join(build_dir, "*.tar.gz")))
+        wheel = next(glob.iglob(os.path.join(build_dir, "*.whl")))
+    except StopIteration:
+        raise RuntimeError(
+            f"No built source archive or wheel found in '{build_dir}'."
+        ) from None
 
     print(f"Built source archive '{source}'.")
     print(f"Built distributions '{wheel}'.")
 
     # check build result
     cmd = ["twine", "check", os.path.join(build_dir, "*")]
-    print(f"Testing built package '{' '.join(cmd)}'")
-    _ = run_cmd(cmd)
-
-
-remove_output_dirs()
-check_black_formatting()
-check_flake8_style()
-check_bandit_security()
-check_docstring_formatting()
-run_docstring_pytest()
-generate_markdown_pytest()
-run_coverage_pytest()
-report_coverage_output()
-generage_package_badges()
-check_package_version()
-build_python_package()
-test_python_package()
+    _ = run_cmd(cmd, description="Testing built package")
+
+
+if __name__ == "__main__":
+    args, options = parse_args()
+    sharded = args.shard_index is not None
+
+    remove_output_dirs(keep_reports=args.combine_shards)
+
+    # a shard only runs its portion of the tests, remaining steps run once
+    if not sharded:
+        # independent checks each wait on a separate process so run them concurrently
+        checks = [
+            check_black_formatting,
+            check_flake8_style,
+            check_bandit_security,
+            check_docstring_formatting,
+        ]
+        run_concurrently(checks)
+
+    if args.combine_shards:
+        combine_shard_tests()
+    else:
+        generate_markdown_pytest()
+        run_coverage_pytest(args, options)
+
+    # coverage reports for shards are only generated once all shards are combined
+    if args.combine_shards:
+        coverage_combine()
+        report_coverage_output()
+
+    if not sharded:
+        generage_package_badges()
+        check_package_version()
+        build_python_package()
+        test_python_package()
@@ -52,7 +52,11 @@ def pytest_configure(config):
 
 # create namespace functions for testing docstrings
 @pytest.fixture(autouse=True)
-def add_docstring_namespace(doctest_namespace):
+def add_docstring_namespace(request, doctest_namespace):
+    # only docstring tests use the namespace, avoid connecting for all other tests
+    if not isinstance(request.node, pytest.DoctestItem):
+        return
+
     doctest_namespace["pd"] = pandas
 
     sql = SQLServer(
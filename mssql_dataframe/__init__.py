@@ -1,11 +1,12 @@
 """Methods for creating, modifying, reading, and writing between dataframes and SQL."""
 
-import logging
 from importlib.metadata import version
 from mssql_dataframe.package import SQLServer  # noqa: F401
 
-# set version number
-__version__ = version("mssql_dataframe")
 
-# initialize logging
-logging.getLogger(__name__)
+def __getattr__(name):
+    """Read the version number from package metadata on first access."""
+    if name == "__version__":
+        globals()["__version__"] = version("mssql_dataframe")
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,43 @@
 """Class for establishing connection to an SQL database."""
 
+import re
+from functools import lru_cache
+
 import pyodbc
 
 from mssql_dataframe.core import custom_errors
 
+# version number in driver names such as "ODBC Driver 18 for SQL Server"
+driver_version = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=None)
+def _installed_drivers() -> tuple:
+    """ODBC drivers installed for SQL Server, enumerated once per process.
+
+    Returns
+    -------
+    installed (tuple) : names of ODBC drivers for SQL Server
+    """
+    return tuple(x for x in pyodbc.drivers() if x.endswith(" for SQL Server"))
+
+
+def _driver_version(driver: str) -> int:
+    """Version number of an ODBC driver name, 0 if the name has no number.
+
+    Parameters
+    ----------
+    driver (str) : name of ODBC driver
+
+    Returns
+    -------
+    version (int) : first number in the driver name
+    """
+    version = driver_version.search(driver)
+    if version is None:
+        return 0
+    return int(version.group())
+
 
 class connect:
     r"""Connect to local, remote, or cloud SQL Server using ODBC connection.
@@ -76,15 +110,16 @@ class connect:
         driver (str) : name of ODBC driver
         drivers_installed (list) : drivers install for SQL Server
         """
-        installed = [x for x in pyodbc.drivers() if x.endswith(" for SQL Server")]
+        installed = list(_installed_drivers())
         if driver_search is None:
-            driver = [x for x in installed if x.endswith(" for SQL Server")]
+            driver = installed
         else:
             driver = [x for x in installed if x == driver_search]
         if not driver:
             raise custom_errors.EnvironmentODBCDriverNotFound(
                 "Unable to find ODBC driver."
             )
-        driver = max(driver)
+        # select the newest driver by version number, as "100" sorts before "18" as a string
+        driver = max(driver, key=lambda x: (_driver_version(x), x))
 
         return driver, installed
@@ -20,6 +20,13 @@ pd.set_option("future.no_silent_downcasting", True)
 
 logger = logging.getLogger(__name__)
 
+# rows per cursor.executemany call, limits the parameter buffer allocated by the driver
+insert_batch_size = 10000
+# rows per cursor.fetchmany call, limits the rows held in memory while reading
+fetch_batch_size = 10000
+# conversion rules keyed by SQL data type for looking up table columns
+rules_by_type = conversion_rules.rules.set_index("sql_type")
+
 
 def _get_schema_name(table_name):
 
@@ -69,12 +76,12 @@ def get_schema(
     else:
         catalog = None
 
-    # get schema
-    schema = []
+    # get schema of all columns in a single call
     cursor = cursor.columns(table=table_name, catalog=catalog, schema=schema_name)
-    for col in cursor:
-        schema.append(list(col))
-    schema = pd.DataFrame(schema, columns=[x[0] for x in cursor.description])
+    schema = cursor.fetchall()
+    schema = pd.DataFrame.from_records(
+        schema, columns=[x[0] for x in cursor.description]
+    )
     # check for no SQL table
     if len(schema) == 0:
         raise custom_errors.SQLTableDoesNotExist(
@@ -126,24 +133,16 @@ def get_schema(
     pk = cursor.primaryKeys(
         table=table_name, catalog=catalog, schema=schema_name
     ).fetchall()
-    pk = pd.DataFrame([list(x) for x in pk], columns=[x[0] for x in cursor.description])
-    pk = pk.rename(columns={"key_seq": "pk_seq"})
-    schema = schema.merge(
-        pk[["column_name", "pk_seq", "pk_name"]],
-        left_on="column_name",
-        right_on="column_name",
-        how="left",
-    )
-    schema["pk_seq"] = schema["pk_seq"].astype("Int64")
-    schema["pk_name"] = schema["pk_name"].astype("string")
-
-    # add conversion rules
-    identity = schema["sql_type"] == "int identity"
-    schema.loc[identity, "sql_type"] = "int"
-    schema = schema.merge(
-        conversion_rules.rules, left_on="sql_type", right_on="sql_type", how="left"
-    )
-    schema.loc[identity, "sql_type"] = "int identity"
+    pk = pd.DataFrame.from_records(pk, columns=[x[0] for x in cursor.description])
+    pk = pk.set_index("column_name")
+    schema["pk_seq"] = schema["column_name"].map(pk["key_seq"]).astype("Int64")
+    schema["pk_name"] = schema["column_name"].map(pk["pk_name"]).astype("string")
+
+    # add conversion rules, looking up each column's SQL data type
+    sql_type = schema["sql_type"].where(schema["sql_type"] != "int identity", "int")
+    rules = rules_by_type.reindex(sql_type)
+    rules.index = schema.index
+    schema = pd.concat([schema, rules], axis="columns")
 
     # key column_name as index, check for undefined conversion rule
     schema["column_name"] = schema["column_name"].astype("string")
@@ -194,9 +193,18 @@ def _precheck_dataframe(schema: pd.DataFrame, dataframe: pd.DataFrame) -> pd.Dat
     # check if unicode to a nonunicode type
     check_unicode(dataframe, schema)
 
-    # convert dataframe based on SQL type
+    # convert dataframe based on SQL type, only for columns not already of that type
+    convert = {
+        col: dtype
+        for col, dtype in schema["pandas_type"].items()
+        if dataframe[col].dtype != pd.api.types.pandas_dtype(dtype)
+    }
     try:
-        dataframe = dataframe.astype(schema["pandas_type"].to_dict())
+        if convert:
+            dataframe = dataframe.astype(convert)
+        else:
+            # values are later adjusted for SQL, so never alter the caller's dataframe
+            dataframe = dataframe.copy()
     except TypeError:  # pragma: no cover
         raise custom_errors.DataframeColumnInvalidValue(
             "Dataframe columns cannot be converted based on their SQL data type"
@@ -215,35 +223,30 @@ def convert_largest_sql_category(dataframe, schema):
     """Convert objects to allow for comparison without truncation."""
     # avoids downcast such as UInt8 value of 10000 to 16
     convert = dataframe.columns[dataframe.dtypes == "object"]
+    category = schema.loc[convert, "sql_category"]
+    offset = schema.loc[convert, "sql_type"] == "datetimeoffset"
+    whole = convert[category == "exact_whole_numeric"]
+
+    # target type of each column by sql_category, converted in a single astype call
+    # BUG: whole numbers first convert to float after replacing pandas.NA
+    # https://github.com/pandas-dev/pandas/issues/25472
+    largest = {col: "float" for col in whole}
+    largest.update(
+        {col: "float64" for col in convert[category == "approximate_decimal_numeric"]}
+    )
+    largest.update(
+        {col: "datetime64[ns]" for col in convert[(category == "date_time") & ~offset]}
+    )
+    largest.update({col: "string" for col in convert[category == "character string"]})
+    values = dataframe[whole]
+    dataframe[whole] = values.where(values.notna(), None)
+    dataframe = _astype_columns(dataframe, largest)
+    dataframe = _astype_columns(dataframe, {col: "Int64" for col in whole})
+    # datetime offset
+    columns = convert[(category == "date_time") & offset]
     try:
-        # exact_whole_numeric
-        columns = convert[schema.loc[convert, "sql_category"] == "exact_whole_numeric"]
-        # BUG: first convert to float after replacing pandas.NA
-        # https://github.com/pandas-dev/pandas/issues/25472
-        dataframe[columns] = dataframe[columns].fillna(np.nan).replace([np.nan], [None])
-        dataframe[columns] = dataframe[columns].astype("float")
-        dataframe[columns] = dataframe[columns].astype("Int64")
-        # approximate_decimal_numeric
-        columns = convert[
-            schema.loc[convert, "sql_category"] == "approximate_decimal_numeric"
-        ]
-        dataframe[columns] = dataframe[columns].astype("float64")
-        # date_time
-        columns = convert[
-            (schema.loc[convert, "sql_category"] == "date_time")
-            & (schema.loc[convert, "sql_type"] != "datetimeoffset")
-        ]
-        dataframe[columns] = dataframe[columns].astype("datetime64[ns]")
-        # datetime offset
-        columns = convert[
-            (schema.loc[convert, "sql_category"] == "date_time")
-            & (schema.loc[convert, "sql_type"] == "datetimeoffset")
-        ]
         for col in columns:
             dataframe[col] = dataframe[col].apply(lambda x: pd.Timestamp(x))
-        # character string
-        columns = convert[schema.loc[convert, "sql_category"] == "character string"]
-        dataframe[columns] = dataframe[columns].astype("string")
     except (TypeError, ValueError):  # pragma: no cover
         raise custom_errors.DataframeColumnInvalidValue(
             "Dataframe columns cannot be converted based on their SQL data type",
@@ -253,23 +256,52 @@ def convert_largest_sql_category(dataframe, schema):
     return dataframe
 
 
+def _astype_columns(dataframe: pd.DataFrame, dtypes: dict) -> pd.DataFrame:
+    """Convert columns in a single astype call, naming only the columns that cannot be converted.
+
+    Parameters
+    ----------
+    dataframe (pandas.DataFrame) : values to convert
+    dtypes (dict) : target data type of each column
+
+    Returns
+    -------
+    dataframe (pandas.DataFrame) : values with converted columns
+    """
+    try:
+        dataframe = dataframe.astype(dtypes)
+    except (TypeError, ValueError):
+        # convert each column separately to find the columns that failed
+        columns = []
+        for col, dtype in dtypes.items():
+            try:
+                dataframe[col].astype(dtype)
+            except (TypeError, ValueError):
+                columns.append(col)
+        raise custom_errors.DataframeColumnInvalidValue(
+            "Dataframe columns cannot be converted based on their SQL data type",
+            columns,
+        )
+
+    return dataframe
+
+
 def check_column_size(dataframe, schema):
     """Raise exception if dataframe value is too large for SQL data type specification."""
-    check = dataframe.copy()
-
-    strings = check.columns[check.dtypes == "string"]
+    strings = dataframe.columns[dataframe.dtypes == "string"]
     if any(strings):
         schema.loc[strings, "max_value"] = schema.loc[strings, "column_size"]
-        check[strings] = check[strings].apply(lambda x: x.str.len())
 
     datetimeoffset = schema.index[schema["sql_type"] == "datetimeoffset"]
 
     binary = schema.index[schema["sql_category"] == "binary"]
     if any(binary):
         schema.loc[binary, "max_value"] = schema.loc[binary, "column_size"]
-        check[binary] = check[binary].apply(lambda x: x.str.len()).astype("Int64")
 
-    standard = check.drop(columns=list(datetimeoffset) + list(binary))
+    # drop returns a new dataframe, so string lengths can replace values without a full copy
+    standard = dataframe.drop(columns=list(datetimeoffset) + list(binary))
+    for col in strings:
+        standard[col] = standard[col].str.len()
     if len(standard.columns) == 0:  # pragma: no cover
         check = pd.DataFrame(columns=["min", "max"])
     else:
@@ -287,15 +319,16 @@ def check_column_size(dataframe, schema):
             ]
         )
 
-    # calculate min/max for binary seperately
+    # calculate min/max for binary seperately, computing lengths once
     for col in binary:
+        length = dataframe[col].str.len()
         check = pd.concat(
             [
                 check,
                 pd.DataFrame(
                     {
-                        "min": min(dataframe[col].str.len()),
-                        "max": max(dataframe[col].str.len()),
+                        "min": length.min(),
+                        "max": length.max(),
                     },
                     index=[col],
                     dtype="Int64",
@@ -410,46 +443,78 @@ def prepare_time(schema, prepped, dataframe):
             f"columns {invalid} are out of range for SQL TIME data type. Allowable range is 00:00:00.0000000-23:59:59.9999999"
         )
 
-    if any(dtype):
-        truncation = prepped[dtype].apply(lambda x: any(x.dt.nanoseconds % 100 > 0))
-        truncation = list(truncation[truncation].index)
-    else:
-        truncation = []
+    truncation = [
+        col for col in dtype if _exceeds_100ns(prepped[col], "timedelta64[ns]")
+    ]
     if any(truncation):
         msg = f"Nanosecond precision for dataframe columns {truncation} will be rounded as SQL data type 'time' allows 7 max decimal places."
         logger.warning(msg)
     # round nanosecond to the 7th decimal place ...123456789 -> ...123456800 for SQL
     for col in truncation:
-        rounded = dataframe[col].apply(
-            lambda x: (
-                pd.Timedelta(
-                    days=x.components.days,
-                    hours=x.components.hours,
-                    minutes=x.components.minutes,
-                    seconds=x.components.seconds,
-                    microseconds=x.components.microseconds,
-                    nanoseconds=round(x.components.nanoseconds / 100) * 100,
-                )
-                if pd.notnull(x)
-                else x
-            )
-        )
+        rounded = dataframe[col].dt.round("100ns")
         dataframe[col] = rounded
         prepped[col] = rounded
-    if any(dtype):
-        # convert to string since python datetime.time allows 6 decimal places but SQL allows 7
-        prepped[dtype] = prepped[dtype].astype("str")
-        prepped[dtype] = prepped[dtype].replace({"NaT": None})
-        prepped[dtype] = prepped[dtype].apply(lambda x: x.str[7:23])
+    # convert to string since python datetime.time allows 6 decimal places but SQL allows 7
+    for col in dtype:
+        prepped[col] = _format_time(prepped[col])
 
     return prepped, dataframe
 
 
+def _exceeds_100ns(values: pd.Series, numpy_type: str) -> bool:
+    """Determine if any timedelta or datetime value has precision finer than 100 nanoseconds.
+
+    Parameters
+    ----------
+    values (pandas.Series) : timedelta or datetime values
+    numpy_type (str) : timedelta64[ns] or datetime64[ns]
+
+    Returns
+    -------
+    exceeds (bool) : True if a value would be rounded by SQL's 7 decimal places
+    """
+    values = values.to_numpy(dtype=numpy_type)
+    # nanoseconds since epoch as integers, ignoring NaT
+    remainder = values.view("int64") % 100
+    exceeds = bool(((remainder != 0) & ~np.isnat(values)).any())
+
+    return exceeds
+
+
+def _format_time(values: pd.Series) -> np.ndarray:
+    """Format timedelta values as SQL TIME strings with 7 decimal places, None for NaT."""
+    values = values.to_numpy(dtype="timedelta64[ns]")
+    # 1970-01-01Thh:mm:ss.fffffffff formatted by numpy for all values at once
+    text = np.datetime64(0, "ns") + values
+    text = np.datetime_as_string(text, unit="ns").astype("<U29")
+    # keep hh:mm:ss.fffffff by slicing characters of every value at once
+    text = text.view("<U1").reshape(len(text), 29)[:, 11:27]
+    text = text.copy().view("<U16")[:, 0].astype(object)
+    text[np.isnat(values)] = None
+
+    return text
+
+
+def _format_datetime(values: pd.Series, decimals: int = 7) -> np.ndarray:
+    """Format datetime values as SQL strings with a number of decimal places, None for NaT."""
+    values = values.to_numpy(dtype="datetime64[ns]")
+    # yyyy-mm-ddThh:mm:ss.fffffffff formatted by numpy for all values at once
+    text = np.datetime_as_string(values, unit="ns").astype("<U29")
+    # keep yyyy-mm-dd hh:mm:ss.fff by slicing characters of every value at once
+    size = 20 + decimals
+    text = text.view("<U1").reshape(len(text), 29)[:, 0:size].copy()
+    text[:, 10] = " "
+    text = text.view(f"<U{size}")[:, 0].astype(object)
+    text[np.isnat(values)] = None
+
+    return text
+
+
 def prepare_datetime(schema, prepped, dataframe):
     """Prepare datetime for writting to SQL."""
     dtype = schema[schema["sql_type"] == "datetime"].index
     if any(dtype):
-        adjust = prepped[dtype].apply(lambda x: any(x.dt.microsecond % 3000 > 0))
+        adjust = prepped[dtype].apply(lambda x: (x.dt.microsecond % 3000 > 0).any())
     else:
         adjust = []
     if any(adjust):
@@ -474,11 +539,9 @@ def prepare_datetime(schema, prepped, dataframe):
             dataframe[col] = rounded
             prepped[col] = rounded
 
-    if any(dtype):
-        # convert to string since python datetime.datetime allows 6 decimals but SQL allows 7
-        prepped[dtype] = prepped[dtype].astype("str")
-        prepped[dtype] = prepped[dtype].replace({"NaT": None})
-        prepped[dtype] = prepped[dtype].apply(lambda x: x.str[0:27])
+    # convert to string with the 3 decimal places allowed by SQL
+    for col in dtype:
+        prepped[col] = _format_datetime(prepped[col], decimals=3)
 
     return prepped, dataframe
 
@@ -487,40 +550,20 @@ def prepare_datetime2(schema, prepped, dataframe):
     """Prepare datetime2 for writting to SQL."""
     dtype = schema[schema["sql_type"] == "datetime2"].index
 
-    if any(dtype):
-        truncation = prepped[dtype].apply(lambda x: any(x.dt.nanosecond % 100 > 0))
-    else:
-        truncation = []
+    truncation = [
+        col for col in dtype if _exceeds_100ns(prepped[col], "datetime64[ns]")
+    ]
     if any(truncation):
-        truncation = list(truncation[truncation].index)
         msg = f"Nanosecond precision for dataframe columns {truncation} will be rounded as SQL data type 'datetime2' allows 7 max decimal places."
         logger.warning(msg)
         # round nanosecond to the 7th decimal place ...145224193 -> ...145224200 for SQL
         for col in truncation:
-            rounded = dataframe[col].apply(
-                lambda x: (
-                    pd.Timestamp(
-                        x.year,
-                        x.month,
-                        x.day,
-                        x.hour,
-                        x.minute,
-                        x.second,
-                        x.microsecond,
-                        round(x.nanosecond / 100) * 100,
-                    )
-                    if pd.notnull(x)
-                    else x
-                )
-            )
-            rounded = rounded.astype("datetime64[ns]")
+            rounded = dataframe[col].dt.round("100ns")
             dataframe[col] = rounded
             prepped[col] = rounded
-    if any(dtype):
-        # convret to string since python datetime.datetime allows 6 decimals but SQL allows 7
-        prepped[dtype] = prepped[dtype].astype("str")
-        prepped[dtype] = prepped[dtype].replace({"NaT": None})
-        prepped[dtype] = prepped[dtype].apply(lambda x: x.str[0:27])
+    # convert to string since python datetime.datetime allows 6 decimals but SQL allows 7
+    for col in dtype:
+        prepped[col] = _format_datetime(prepped[col])
 
     return prepped, dataframe
 
@@ -633,7 +676,7 @@ def prepare_values(
     Returns
     -------
     dataframe (pandas.DataFrame) : values that may be altered to conform to SQL precision limitations
-    values (list) : values to pass to pyodbc.connect.cursor.executemany
+    values (list) : row tuples to pass to pyodbc.connect.cursor.executemany
 
     """
     # create a copy to preserve values in return
@@ -671,17 +714,95 @@ def prepare_values(
     # if prepped.shape[1] == 1 and prepped.select_dtypes("datetime").shape[1] == 1:
     #     prepped = prepped.astype(object)
 
-    # BUG: treat pandas NA,NaT,etc as NULL in SQL
-    # ideally we woudn't want to convert everything to an object
-    prepped = prepped.astype(object)
-    prepped = prepped.where(pd.notnull(prepped), None)
+    # treat pandas NA,NaT,etc as NULL in SQL, converting each column seperately
+    # avoids building an intermediate object array of the whole dataframe
+    columns = [
+        np.where(values.isna(), None, values.to_numpy(dtype=object))
+        for _, values in prepped.items()
+    ]
 
-    # values for pyodbc cursor executemany
-    values = prepped.values.tolist()
+    # values for pyodbc cursor executemany, rows as tuples are smaller than lists
+    values = list(zip(*columns))
 
     return dataframe, values
 
 
+# structures of raw bytes for SQL types decoded one value at a time
+struct_time = struct.Struct("<4hI")
+struct_datetime2 = struct.Struct("hHHHHHI")
+struct_datetime = struct.Struct("iI")
+struct_datetimeoffset = struct.Struct("<6hI2h")
+# DATETIME values are days and ticks since 1900-01-01
+epoch_datetime = pd.Timestamp(year=1900, month=1, day=1)
+
+
+def SQL_SS_TIME2(raw_bytes):
+    """Output converter for SQL TIME to pandas Timedelta."""
+    hour, minute, second, _, fraction = struct_time.unpack(raw_bytes)
+    return pd.Timedelta((hour * 3600 + minute * 60 + second) * 10**9 + fraction)
+
+
+def SQL_TYPE_TIMESTAMP(raw_bytes):
+    """Output converter for SQL DATETIME2/DATETIME to pandas Timestamp."""
+    # DATETIME2 (16 bytes)
+    if len(raw_bytes) == 16:
+        year, month, day, hour, minute, second, fraction = struct_datetime2.unpack(
+            raw_bytes
+        )
+        timestamp = pd.Timestamp(
+            year=year,
+            month=month,
+            day=day,
+            hour=hour,
+            minute=minute,
+            second=second,
+            microsecond=fraction // 1000,
+            nanosecond=fraction % 1000,
+        )
+    # DATETIME (8 bytes)
+    else:
+        days, ticks = struct_datetime.unpack(raw_bytes)
+        timestamp = epoch_datetime + pd.Timedelta(
+            days=days, milliseconds=round(3.33333333 * ticks)
+        )
+
+    return timestamp
+
+
+def SQL_TYPE_DATETIMEOFFSET(raw_bytes):
+    """Output converter for SQL DATETIMEOFFSET to pandas Timestamp with timezone."""
+    (
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        fraction,
+        offset_hour,
+        offset_minute,
+    ) = struct_datetimeoffset.unpack(raw_bytes)
+
+    timestamp = pd.Timestamp(
+        year=year,
+        month=month,
+        day=day,
+        hour=hour,
+        minute=minute,
+        second=second,
+        microsecond=fraction // 1000,
+        nanosecond=fraction % 1000,
+        tzinfo=pytz.FixedOffset(offset_hour * 60 + offset_minute),
+    )
+
+    return timestamp
+
+
+def SQL_TYPE_VARBINARY(raw_bytes):
+    """Output converter for SQL VARBINARY to bytes without null trailing bytes."""
+    return raw_bytes.rstrip(b"\x00")
+
+
 def convert_time(connection):
     """
     Convert SQL time to timedelta.
@@ -693,17 +814,6 @@ def convert_time(connection):
     SQL TIME only supports 7 decimal places for precision
     SQL TIME range is '00:00:00.0000000' to '23:59:59.9999999' while pandas allows multiple days and negatives
     """
-
-    def SQL_SS_TIME2(raw_bytes, pattern=struct.Struct("<4hI")):
-        hour, minute, second, _, fraction = pattern.unpack(raw_bytes)
-        return pd.Timedelta(
-            hours=hour,
-            minutes=minute,
-            seconds=second,
-            microseconds=fraction // 1000,
-            nanoseconds=fraction % 1000,
-        )
-
     connection.add_output_converter(pyodbc.SQL_SS_TIME2, SQL_SS_TIME2)
 
     return connection
@@ -722,32 +832,6 @@ def convert_timestamp(connection):
     DATETIME2 allows '0001-01-01' through '9999-12-31'
     DATETIME allows '1753-01-01' through '9999-12-31'
     """
-
-    def SQL_TYPE_TIMESTAMP(raw_bytes):
-        # DATETIME2 (16 bytes)
-        if len(raw_bytes) == 16:
-            pattern = struct.Struct("hHHHHHI")
-            year, month, day, hour, minute, second, fraction = pattern.unpack(raw_bytes)
-            timestamp = pd.Timestamp(
-                year=year,
-                month=month,
-                day=day,
-                hour=hour,
-                minute=minute,
-                second=second,
-                microsecond=fraction // 1000,
-                nanosecond=fraction % 1000,
-            )
-        # DATETIME (8 bytes)
-        else:
-            pattern = struct.Struct("iI")
-            days, ticks = pattern.unpack(raw_bytes)
-            timestamp = pd.Timestamp(year=1900, month=1, day=1) + pd.Timedelta(
-                days=days, milliseconds=round(3.33333333 * ticks)
-            )
-
-        return timestamp
-
     connection.add_output_converter(pyodbc.SQL_TYPE_TIMESTAMP, SQL_TYPE_TIMESTAMP)
 
     return connection
@@ -759,34 +843,6 @@ def convert_datetimeoffset(connection):
 
     Types: pyodbc "UNDEFINED" = T-SQL "DATETIMEOFFSET" = ODBC SQL type "-155"
     """
-
-    def SQL_TYPE_DATETIMEOFFSET(raw_bytes):
-        (
-            year,
-            month,
-            day,
-            hour,
-            minute,
-            second,
-            fraction,
-            offset_hour,
-            offset_minute,
-        ) = struct.unpack("<6hI2h", raw_bytes)
-
-        timestamp = pd.Timestamp(
-            year=year,
-            month=month,
-            day=day,
-            hour=hour,
-            minute=minute,
-            second=second,
-            microsecond=fraction // 1000,
-            nanosecond=fraction % 1000,
-            tzinfo=pytz.FixedOffset(offset_hour * 60 + offset_minute),
-        )
-
-        return timestamp
-
     connection.add_output_converter(-155, SQL_TYPE_DATETIMEOFFSET)
 
     return connection
@@ -798,15 +854,153 @@ def convert_varbinary(connection):
 
     Types: pyodbc "pyodbc.SQL_VARBINARY" = T-SQL "VARBINARY" = ODBC SQL type "-3"
     """
+    connection.add_output_converter(pyodbc.SQL_VARBINARY, SQL_TYPE_VARBINARY)
 
-    def SQL_TYPE_VARBINARY(raw_bytes):
-        raw_bytes = raw_bytes.rstrip(b"\x00")
+    return connection
 
-        return raw_bytes
 
-    connection.add_output_converter(pyodbc.SQL_VARBINARY, SQL_TYPE_VARBINARY)
+# output converters added by prepare_connection
+output_converters = {
+    pyodbc.SQL_SS_TIME2: SQL_SS_TIME2,
+    pyodbc.SQL_TYPE_TIMESTAMP: SQL_TYPE_TIMESTAMP,
+    -155: SQL_TYPE_DATETIMEOFFSET,
+    pyodbc.SQL_VARBINARY: SQL_TYPE_VARBINARY,
+}
+
+# layout of raw bytes for SQL types decoded for entire columns at once
+raw_time = np.dtype(
+    [
+        ("hour", "<i2"),
+        ("minute", "<i2"),
+        ("second", "<i2"),
+        ("padding", "<i2"),
+        ("fraction", "<u4"),
+    ]
+)
+raw_datetime2 = np.dtype(
+    [
+        ("year", "<i2"),
+        ("month", "<u2"),
+        ("day", "<u2"),
+        ("hour", "<u2"),
+        ("minute", "<u2"),
+        ("second", "<u2"),
+        ("fraction", "<u4"),
+    ]
+)
+raw_datetime = np.dtype([("days", "<i4"), ("ticks", "<u4")])
+# pandas Timestamp range as (microseconds, nanoseconds) since epoch
+timestamp_bounds = (
+    divmod(pd.Timestamp.min.value, 1000),
+    divmod(pd.Timestamp.max.value, 1000),
+)
 
-    return connection
+
+def _seconds_of_day(parts: np.ndarray) -> np.ndarray:
+    """Total seconds from the hour, minute, and second fields of raw values."""
+    return (
+        parts["hour"].astype("int64") * 3600
+        + parts["minute"].astype("int64") * 60
+        + parts["second"].astype("int64")
+    )
+
+
+def decode_raw(values: list, sql_type: str) -> np.ndarray:
+    """Decode raw bytes of SQL TIME, DATETIME2, or DATETIME values for an entire column.
+
+    Produces the same values as the output converters in convert_time and convert_timestamp
+    without a Python function call and pandas object for every value.
+
+    Parameters
+    ----------
+    values (list) : raw bytes for each value in a column, None for NULL
+    sql_type (str) : SQL data type of values, either time, datetime2, or datetime
+
+    Returns
+    -------
+    decoded (numpy.ndarray) : values as timedelta64[ns] for time, otherwise datetime64[ns]
+    """
+    notnull = np.array([x is not None for x in values], dtype=bool)
+    raw = b"".join(values[idx] for idx in np.flatnonzero(notnull))
+
+    if sql_type == "time":
+        parts = np.frombuffer(raw, dtype=raw_time)
+        nanoseconds = _seconds_of_day(parts) * 10**9 + parts["fraction"]
+        decoded = nanoseconds.view("timedelta64[ns]")
+        column = np.full(len(values), np.timedelta64("NaT", "ns"))
+    else:
+        if sql_type == "datetime2":
+            parts = np.frombuffer(raw, dtype=raw_datetime2)
+            months = (parts["year"].astype("int64") - 1970) * 12 + parts["month"] - 1
+            days = parts["day"].astype("int64") - 1
+            days = months.astype("datetime64[M]") + days.astype("timedelta64[D]")
+            microseconds = _seconds_of_day(parts) * 10**6 + parts["fraction"] // 1000
+            whole = days + microseconds.astype("timedelta64[us]")
+            nanoseconds = parts["fraction"] % 1000
+        else:
+            parts = np.frombuffer(raw, dtype=raw_datetime)
+            # DATETIME ticks are 1/300 of a second
+            milliseconds = np.round(3.33333333 * parts["ticks"]).astype("int64")
+            milliseconds += parts["days"].astype("int64") * 86400000
+            whole = np.datetime64("1900-01-01", "ms") + milliseconds.astype(
+                "timedelta64[ms]"
+            )
+            nanoseconds = np.zeros(len(parts), dtype="int64")
+        # raise an exception like pandas for values outside of the nanosecond range
+        # comparing microseconds then nanoseconds to avoid overflowing int64
+        microseconds = whole.astype("datetime64[us]").astype("int64")
+        (lower_us, lower_ns), (upper_us, upper_ns) = timestamp_bounds
+        invalid = (
+            (microseconds < lower_us)
+            | ((microseconds == lower_us) & (nanoseconds < lower_ns))
+            | (microseconds > upper_us)
+            | ((microseconds == upper_us) & (nanoseconds > upper_ns))
+        )
+        if invalid.any():
+            raise pd.errors.OutOfBoundsDatetime(
+                f"Out of bounds nanosecond timestamp: {whole[invalid][0]}"
+            )
+        decoded = (microseconds * 1000 + nanoseconds).view("datetime64[ns]")
+        column = np.full(len(values), np.datetime64("NaT", "ns"))
+
+    column[notnull] = decoded
+
+    return column
+
+
+# numpy data type backing nullable pandas types
+masked_types = {
+    "boolean": "bool",
+    "UInt8": "uint8",
+    "Int16": "int16",
+    "Int32": "int32",
+    "Int64": "int64",
+}
+
+
+def masked_array(values: list, pandas_type: str) -> pd.api.extensions.ExtensionArray:
+    """Create a nullable pandas boolean or integer array from values fetched for a column.
+
+    Parameters
+    ----------
+    values (list) : values for a column, None for NULL
+    pandas_type (str) : nullable pandas data type from masked_types
+
+    Returns
+    -------
+    array (pandas.arrays.BooleanArray|pandas.arrays.IntegerArray) : values with a mask for NULL
+    """
+    values = np.array(values, dtype=object)
+    mask = np.equal(values, None)
+    values[mask] = 0
+    values = values.astype(masked_types[pandas_type])
+
+    if pandas_type == "boolean":
+        array = pd.arrays.BooleanArray(values, mask)
+    else:
+        array = pd.arrays.IntegerArray(values, mask)
+
+    return array
 
 
 def prepare_connection(connection: pyodbc.connect) -> pyodbc.connect:
@@ -837,6 +1031,23 @@ def prepare_connection(connection: pyodbc.connect) -> pyodbc.connect:
     return connection
 
 
+def _is_prepared(connection: pyodbc.connect) -> bool:
+    """Determine if output converters have already been added by prepare_connection.
+
+    Parameters
+    ----------
+    connection (pyodbc.connect) : connection to database
+
+    Returns
+    -------
+    prepared (bool) : True if every output converter is registered
+    """
+    return all(
+        connection.get_output_converter(sqltype) is converter
+        for sqltype, converter in output_converters.items()
+    )
+
+
 def insert_values(
     table_name: str,
     dataframe: pd.DataFrame,
@@ -892,7 +1103,10 @@ def insert_values(
         {params}
     )
     """  # nosec hardcoded_sql_expressions
-    cursor.executemany(statement, values)
+    # insert in batches then commit all batches at once
+    for start in range(0, len(values), insert_batch_size):
+        end = start + insert_batch_size
+        cursor.executemany(statement, values[start:end])
     cursor.commit()
 
     # values that may be altered to conform to SQL precision limitations
@@ -915,27 +1129,52 @@ def read_values(
     -------
     result (pandas.DataFrame) : resulting data from performing statement
     """
-    # add output converters
-    connection = prepare_connection(connection)
+    # add output converters once per connection
+    if not _is_prepared(connection):
+        connection = prepare_connection(connection)
+    # fetch time and timestamp values as raw bytes to decode entire columns at once
+    connection.add_output_converter(pyodbc.SQL_SS_TIME2, bytes)
+    connection.add_output_converter(pyodbc.SQL_TYPE_TIMESTAMP, bytes)
 
     # create cursor to fetch data
     cursor = connection.cursor()
 
     # read data from SQL
-    if args is None:
-        result = cursor.execute(statement).fetchall()
-    else:
-        result = cursor.execute(statement, *args).fetchall()
-    columns = pd.Series([col[0] for col in cursor.description])
+    try:
+        if args is None:
+            cursor.execute(statement)
+        else:
+            cursor.execute(statement, *args)
+        if cursor.description is None:
+            raise pyodbc.ProgrammingError("No results.  Previous SQL was not a query.")
+        columns = [col[0] for col in cursor.description]
+        # fetch in batches, storing by column so rows are released after each batch
+        values = [[] for _ in columns]
+        rows = cursor.fetchmany(fetch_batch_size)
+        while rows:
+            for column, vals in zip(values, zip(*rows)):
+                column.extend(vals)
+            rows = cursor.fetchmany(fetch_batch_size)
+    finally:
+        # restore converters for individual values
+        connection = convert_time(connection)
+        connection = convert_timestamp(connection)
+    columns = pd.Series(columns)
 
     # form output using SQL schema and explicit pandas types
     if any(~columns.isin(schema.index)):
         columns = list(columns[~columns.isin(schema.index)])
         raise AttributeError(f"missing columns from schema: {columns}")
     dtypes = schema.loc[columns, "pandas_type"].to_dict()
-    result = {col: [row[idx] for row in result] for idx, col in enumerate(columns)}
-    result = {col: pd.Series(vals, dtype=dtypes[col]) for col, vals in result.items()}
-    result = pd.DataFrame(result)
+    result = {}
+    for col, vals in zip(columns, values):
+        sql_type = schema.at[col, "sql_type"]
+        if sql_type in ["time", "datetime2", "datetime"]:
+            vals = decode_raw(vals, sql_type)
+        elif dtypes[col] in masked_types:
+            vals = masked_array(vals, dtypes[col])
+        result[col] = pd.Series(vals, dtype=dtypes[col])
+    result = pd.DataFrame(result, copy=False)
 
     # replace missing values in object columns with pandas type
     datetimeoffset = schema.index[schema["sql_type"] == "datetimeoffset"]
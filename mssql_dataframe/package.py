@@ -100,7 +100,8 @@ class SQLServer(connect):
         # output actual connection info (possibly derived within connection object)
         # logger.debug(f"Connection Info: {self.connection_spec}")
         # output Python/SQL/package versions
-        logger.debug(f"Version Numbers: {self.version_spec}")
+        # formatted only if debug logging is enabled
+        logger.debug("Version Numbers: %s", self.version_spec)
 
     def get_schema(self, table_name: str):
         """Get schema of an SQL table and the defined conversion rules between data types.
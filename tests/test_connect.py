@@ -3,7 +3,7 @@ import env
 import pyodbc
 import pytest
 
-from mssql_dataframe.connect import connect
+from mssql_dataframe.connect import connect, _installed_drivers
 from mssql_dataframe.core import custom_errors
 
 
@@ -48,3 +48,35 @@ def test_exceptions():
             driver="",
             trusted_connection="yes",
         )
+
+
+def test_driver_cache(monkeypatch):
+    calls = []
+
+    def drivers():
+        calls.append(1)
+        return [
+            "ODBC Driver 17 for SQL Server",
+            "ODBC Driver 100 for SQL Server",
+            "Legacy Driver for SQL Server",
+            "SQL Server",
+        ]
+
+    monkeypatch.setattr(pyodbc, "drivers", drivers)
+    _installed_drivers.cache_clear()
+    try:
+        driver, installed = connect._get_driver(None)
+        assert driver == "ODBC Driver 100 for SQL Server"
+        assert installed == [
+            "ODBC Driver 17 for SQL Server",
+            "ODBC Driver 100 for SQL Server",
+            "Legacy Driver for SQL Server",
+        ]
+        driver, _ = connect._get_driver("ODBC Driver 17 for SQL Server")
+        assert driver == "ODBC Driver 17 for SQL Server"
+        # driver names without a version number are treated as version 0
+        driver, _ = connect._get_driver("Legacy Driver for SQL Server")
+        assert driver == "Legacy Driver for SQL Server"
+        assert len(calls) == 1
+    finally:
+        _installed_drivers.cache_clear()
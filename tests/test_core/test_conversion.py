@@ -1,11 +1,14 @@
 import env
+import struct
 
+import numpy as np
 import pandas as pd
+import pyodbc
 
 import pytest
 
 from mssql_dataframe.connect import connect
-from mssql_dataframe.core import conversion
+from mssql_dataframe.core import conversion, custom_errors
 
 pd.options.mode.chained_assignment = "raise"
 
@@ -39,6 +42,36 @@ def test_larger_sql_range():
         )
 
 
+def test_convert_largest_sql_category_errors():
+    schema = pd.DataFrame(
+        {
+            "sql_category": ["exact_whole_numeric", "date_time", "character string"],
+            "sql_type": ["int", "datetime2", "varchar"],
+        },
+        index=["ColumnA", "ColumnB", "ColumnC"],
+    )
+    dataframe = pd.DataFrame(
+        {
+            "ColumnA": ["1", None],
+            "ColumnB": ["2021-01-01", None],
+            "ColumnC": ["a", None],
+        },
+        dtype="object",
+    )
+    # error names only the column that cannot be converted
+    invalid = dataframe.copy()
+    invalid["ColumnB"] = pd.Series(["not a date", None], dtype="object")
+    with pytest.raises(custom_errors.DataframeColumnInvalidValue) as error:
+        conversion.convert_largest_sql_category(invalid, schema)
+    assert error.value.args[1] == ["ColumnB"]
+    # whole numbers that are not integers
+    invalid = dataframe.copy()
+    invalid["ColumnA"] = pd.Series([1.5, None], dtype="object")
+    with pytest.raises(custom_errors.DataframeColumnInvalidValue) as error:
+        conversion.convert_largest_sql_category(invalid, schema)
+    assert error.value.args[1] == ["ColumnA"]
+
+
 def test_read_values_errors(sql):
     schema, _ = conversion.get_schema(
         connection=sql, table_name="##test_conversion_error"
@@ -57,3 +90,192 @@ def test_read_values_errors(sql):
             schema=schema,
             connection=sql,
         )
+    # error for a statement that doesn't return results
+    with pytest.raises(pyodbc.ProgrammingError):
+        conversion.read_values(
+            statement="DECLARE @id BIGINT = 1",
+            schema=schema,
+            connection=sql,
+        )
+
+
+def test_read_values_restores_converters(sql):
+    schema, _ = conversion.get_schema(
+        connection=sql, table_name="##test_conversion_error"
+    )
+    # connection reused for multiple reads
+    for _ in range(2):
+        _ = conversion.read_values(
+            statement="SELECT * FROM ##test_conversion_error",
+            schema=schema,
+            connection=sql,
+        )
+    assert conversion._is_prepared(sql)
+    # values fetched outside of read_values are converted one at a time
+    cursor = sql.cursor()
+    cursor.execute("""
+        SELECT
+            CAST('01:02:03.1234567' AS TIME),
+            CAST('2020-01-02 03:04:05.1234567' AS DATETIME2),
+            CAST('2020-01-02 03:04:05.007' AS DATETIME)
+        """)
+    time, datetime2, datetime = cursor.fetchall()[0]
+    assert time == pd.Timedelta("01:02:03.1234567")
+    assert datetime2 == pd.Timestamp("2020-01-02 03:04:05.1234567")
+    assert datetime == pd.Timestamp("2020-01-02 03:04:05.007")
+
+
+def test_decode_raw():
+    # time with a NULL and the min/max of SQL TIME
+    values = [
+        struct.pack("<4hI", 0, 0, 0, 0, 0),
+        None,
+        struct.pack("<4hI", 23, 59, 59, 0, 999999900),
+    ]
+    decoded = conversion.decode_raw(values, "time")
+    expected = np.array([0, "NaT", 86399999999900], dtype="timedelta64[ns]")
+    assert np.array_equal(decoded, expected, equal_nan=True)
+
+    # datetime2 with a NULL and the min/max of pandas nanosecond timestamps rounded to 7 decimals
+    values = [
+        struct.pack("hHHHHHI", 1677, 9, 21, 0, 12, 43, 145224200),
+        None,
+        struct.pack("hHHHHHI", 2262, 4, 11, 23, 47, 16, 854775800),
+    ]
+    decoded = conversion.decode_raw(values, "datetime2")
+    expected = np.array(
+        ["1677-09-21T00:12:43.145224200", "NaT", "2262-04-11T23:47:16.854775800"],
+        dtype="datetime64[ns]",
+    )
+    assert np.array_equal(decoded, expected, equal_nan=True)
+
+    # datetime as days and 1/300 second ticks since 1900-01-01
+    values = [struct.pack("iI", 0, 0), None, struct.pack("iI", -53690, 25919999)]
+    decoded = conversion.decode_raw(values, "datetime")
+    expected = np.array(
+        ["1900-01-01", "NaT", "1753-01-01T23:59:59.997"], dtype="datetime64[ns]"
+    )
+    assert np.array_equal(decoded, expected, equal_nan=True)
+
+    # empty and all NULL columns
+    assert len(conversion.decode_raw([], "time")) == 0
+    assert len(conversion.decode_raw([], "datetime2")) == 0
+    assert np.isnat(conversion.decode_raw([None, None], "datetime")).all()
+
+    # values after 2262 are outside of the pandas nanosecond range
+    with pytest.raises(pd.errors.OutOfBoundsDatetime):
+        conversion.decode_raw(
+            [struct.pack("hHHHHHI", 2263, 1, 1, 0, 0, 0, 0)], "datetime2"
+        )
+    with pytest.raises(pd.errors.OutOfBoundsDatetime):
+        conversion.decode_raw([struct.pack("iI", 2958463, 0)], "datetime")
+
+
+def test_masked_array():
+    array = conversion.masked_array([1, None, 255], "UInt8")
+    assert array.dtype == "UInt8"
+    assert array.isna().tolist() == [False, True, False]
+    assert array[2] == 255
+
+    array = conversion.masked_array([True, None, False], "boolean")
+    assert array.dtype == "boolean"
+    assert array.isna().tolist() == [False, True, False]
+    assert not array[2]
+
+    assert len(conversion.masked_array([], "Int64")) == 0
+
+
+def test_format_time():
+    values = pd.Series(
+        pd.to_timedelta([0, None, 86399999999900], unit="ns"), dtype="timedelta64[ns]"
+    )
+    formatted = conversion._format_time(values)
+    assert formatted.tolist() == ["00:00:00.0000000", None, "23:59:59.9999999"]
+    assert len(conversion._format_time(values.iloc[0:0])) == 0
+
+
+def test_format_datetime():
+    values = pd.Series(
+        [
+            pd.Timestamp("1677-09-21 00:12:43.1452242"),
+            pd.NaT,
+            pd.Timestamp("2262-04-11 23:47:16.854775807"),
+        ],
+        dtype="datetime64[ns]",
+    )
+    formatted = conversion._format_datetime(values)
+    assert formatted.tolist() == [
+        "1677-09-21 00:12:43.1452242",
+        None,
+        "2262-04-11 23:47:16.8547758",
+    ]
+    assert len(conversion._format_datetime(values.iloc[0:0])) == 0
+
+    # SQL datetime allows 3 decimal places
+    values = pd.Series(
+        [pd.Timestamp("1753-01-01 23:59:59.997"), pd.NaT], dtype="datetime64[ns]"
+    )
+    formatted = conversion._format_datetime(values, decimals=3)
+    assert formatted.tolist() == ["1753-01-01 23:59:59.997", None]
+
+
+def test_exceeds_100ns():
+    values = pd.Series(pd.to_timedelta([100, None], unit="ns"))
+    assert not conversion._exceeds_100ns(values, "timedelta64[ns]")
+    values = pd.Series(pd.to_timedelta([101, None], unit="ns"))
+    assert conversion._exceeds_100ns(values, "timedelta64[ns]")
+
+    # before 1970 the nanoseconds since epoch are negative
+    values = pd.Series(
+        [pd.Timestamp("1677-09-21 00:12:43.1452242"), pd.NaT], dtype="datetime64[ns]"
+    )
+    assert not conversion._exceeds_100ns(values, "datetime64[ns]")
+    values = pd.Series(
+        [pd.Timestamp("1677-09-21 00:12:43.145224201"), pd.NaT],
+        dtype="datetime64[ns]",
+    )
+    assert conversion._exceeds_100ns(values, "datetime64[ns]")
+
+    # only NULL or no values
+    assert not conversion._exceeds_100ns(
+        pd.Series([pd.NaT], dtype="datetime64[ns]"), "datetime64[ns]"
+    )
+    assert not conversion._exceeds_100ns(
+        pd.Series([], dtype="timedelta64[ns]"), "timedelta64[ns]"
+    )
+
+
+def test_output_converters():
+    # TIME
+    raw = struct.pack("<4hI", 23, 59, 59, 0, 999999900)
+    assert conversion.SQL_SS_TIME2(raw) == pd.Timedelta("23:59:59.9999999")
+    raw = struct.pack("<4hI", 0, 0, 0, 0, 0)
+    assert conversion.SQL_SS_TIME2(raw) == pd.Timedelta(0)
+
+    # DATETIME2
+    raw = struct.pack("hHHHHHI", 2262, 4, 11, 23, 47, 16, 854775700)
+    assert conversion.SQL_TYPE_TIMESTAMP(raw) == pd.Timestamp(
+        "2262-04-11 23:47:16.8547757"
+    )
+    raw = struct.pack("hHHHHHI", 1677, 9, 21, 0, 12, 43, 145224200)
+    assert conversion.SQL_TYPE_TIMESTAMP(raw) == pd.Timestamp(
+        "1677-09-21 00:12:43.1452242"
+    )
+
+    # DATETIME rounded to increments of .000, .003, or .007 seconds
+    raw = struct.pack("iI", 0, 0)
+    assert conversion.SQL_TYPE_TIMESTAMP(raw) == pd.Timestamp("1900-01-01")
+    raw = struct.pack("iI", -53690, 25919999)
+    assert conversion.SQL_TYPE_TIMESTAMP(raw) == pd.Timestamp("1753-01-01 23:59:59.997")
+    raw = struct.pack("iI", 44195, 1)
+    assert conversion.SQL_TYPE_TIMESTAMP(raw) == pd.Timestamp("2021-01-01 00:00:00.003")
+
+    # DATETIMEOFFSET
+    raw = struct.pack("<6hI2h", 2021, 12, 31, 23, 59, 59, 123456700, -5, -30)
+    timestamp = conversion.SQL_TYPE_DATETIMEOFFSET(raw)
+    assert timestamp == pd.Timestamp("2021-12-31 23:59:59.1234567-05:30")
+    assert timestamp.utcoffset() == pd.Timedelta(hours=-5, minutes=-30)
+
+    # VARBINARY
+    assert conversion.SQL_TYPE_VARBINARY(b"\x01\x00\x02\x00\x00") == b"\x01\x00\x02"
+    assert conversion.SQL_TYPE_VARBINARY(b"") == b""
@@ -94,6 +94,24 @@ def test_insert_composite_pk(sql):
     assert all(result["ColumnC"] == 1)
 
 
+def test_insert_batches(sql, monkeypatch):
+    table_name = "##test_insert_batches"
+
+    columns = {"ColumnA": "INT"}
+    sql.create.table(table_name, columns)
+
+    # insert using multiple batches, including a partial final batch
+    monkeypatch.setattr(conversion, "insert_batch_size", 2)
+    dataframe = pd.DataFrame({"ColumnA": [1, 2, 3, 4, 5]})
+    dataframe = sql.insert.insert(table_name, dataframe)
+
+    schema, _ = conversion.get_schema(sql.connection, table_name)
+    result = conversion.read_values(
+        f"SELECT ColumnA FROM {table_name} ORDER BY ColumnA", schema, sql.connection
+    )
+    assert result["ColumnA"].equals(pd.Series([1, 2, 3, 4, 5], dtype="Int32"))
+
+
 def test_insert_include_metadata_timestamps(sql, caplog):
     table_name = "##test_insert_include_metadata_timestamps"
 
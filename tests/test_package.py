@@ -1,8 +1,11 @@
 import env
 import logging
+from importlib.metadata import version
 
 import pandas as pd
 
+import pytest
+
 import mssql_dataframe
 from mssql_dataframe.package import SQLServer
 
@@ -21,6 +24,15 @@ attributes = [
 def test_version():
     assert isinstance(mssql_dataframe.__version__, str)
     assert len(mssql_dataframe.__version__) > 0
+    # version is read from package metadata by the module __getattr__
+    assert mssql_dataframe.__getattr__("__version__") == version("mssql_dataframe")
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError) as error:
+        _ = mssql_dataframe.does_not_exist
+    message = "module 'mssql_dataframe' has no attribute 'does_not_exist'"
+    assert str(error.value) == message
 
 
 def test_SQLServer_basic(caplog):